@@ -17,8 +17,10 @@ EXTRAS_REQUIRE = {
         "webtest==3.0.0",
         "webtest-aiohttp==2.0.0",
         "pytest-aiohttp>=0.3.0",
+        "orjson",
     ]
     + FRAMEWORKS,
+    "orjson": ["orjson"],
     "lint": [
         "mypy==0.910",
         "flake8==4.0.1",
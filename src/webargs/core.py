@@ -183,13 +183,12 @@ class Parser:
 
         :raises: ValueError if a given location is invalid.
         """
-        valid_locations = set(self.__location_map__.keys())
-        if location not in valid_locations:
-            raise ValueError(f"Invalid location argument: {location}")
-
         # Parsing function to call
         # May be a method name (str) or a function
-        func = self.__location_map__[location]
+        try:
+            func = self.__location_map__[location]
+        except KeyError:
+            raise ValueError(f"Invalid location argument: {location}") from None
         if isinstance(func, str):
             return getattr(self, func)
         return func
@@ -36,13 +36,12 @@ class MultiDictProxy(Mapping):
             return is_multiple_attr
         return isinstance(field, self.known_multi_fields)
 
-    def _collect_multiple_keys(self, schema: ma.Schema):
-        result = set()
-        for name, field in schema.fields.items():
-            if not self._is_multiple(field):
-                continue
-            result.add(field.data_key if field.data_key is not None else name)
-        return result
+    def _collect_multiple_keys(self, schema: ma.Schema) -> typing.FrozenSet[str]:
+        return frozenset(
+            field.data_key if field.data_key is not None else name
+            for name, field in schema.fields.items()
+            if self._is_multiple(field)
+        )
 
     def __getitem__(self, key):
         val = self.data.get(key, ma.missing)
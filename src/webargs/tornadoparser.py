@@ -13,14 +13,27 @@ Example: ::
             response = {'message': 'Hello {}'.format(args['name'])}
             self.write(response)
 """
+import functools
+import json
+
 import tornado.web
 import tornado.concurrent
-from tornado.escape import _unicode
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson is only needed for TornadoParser.USE_ORJSON
+    orjson = None  # type: ignore[assignment]
 
 from webargs import core
 from webargs.multidictproxy import MultiDictProxy
 
 
+_Future = tornado.concurrent.Future
+
+# reason phrases to send with validation error responses, by status code
+_REASONS = {422: "Unprocessable Entity"}
+
+
 class HTTPError(tornado.web.HTTPError):
     """`tornado.web.HTTPError` that stores validation errors."""
 
@@ -30,9 +43,21 @@ class HTTPError(tornado.web.HTTPError):
         super().__init__(*args, **kwargs)
 
 
+@functools.lru_cache(maxsize=128)
+def _content_type_is_json(content_type):
+    # clients on keep-alive connections tend to send the same Content-Type
+    # over and over, so memoize the verdict rather than re-parsing the header
+    return core.is_json(content_type)
+
+
 def is_json_request(req):
     content_type = req.headers.get("Content-Type")
-    return content_type is not None and core.is_json(content_type)
+    return content_type is not None and _content_type_is_json(content_type)
+
+
+# based on tornado.web.RequestHandler.decode_argument
+def _invalid_unicode_error(key, value):
+    return HTTPError(400, f"Invalid unicode in {key}: {value[:40]!r}")
 
 
 class WebArgsTornadoMultiDictProxy(MultiDictProxy):
@@ -43,34 +68,44 @@ class WebArgsTornadoMultiDictProxy(MultiDictProxy):
 
     def __getitem__(self, key):
         try:
-            value = self.data.get(key, core.missing)
-            if value is core.missing:
-                return core.missing
-            if key in self.multiple_keys:
-                return [
-                    _unicode(v) if isinstance(v, (str, bytes)) else v for v in value
-                ]
-            if value and isinstance(value, (list, tuple)):
-                value = value[0]
-
-            if isinstance(value, (str, bytes)):
-                return _unicode(value)
-            return value
-        # based on tornado.web.RequestHandler.decode_argument
-        except UnicodeDecodeError:
-            raise HTTPError(400, f"Invalid unicode in {key}: {value[:40]!r}")
+            value = self.data[key]
+        except KeyError:
+            return core.missing
+        if key in self.multiple_keys:
+            try:
+                return self._decode_list(value)
+            except UnicodeDecodeError:
+                raise _invalid_unicode_error(key, value)
+        # tornado's argument containers always hold lists
+        if type(value) is list and value:
+            value = value[0]
+
+        # str values are already decoded, so only bytes need to be decoded;
+        # exact type checks keep the common str path cheap and outside of
+        # any try block
+        if type(value) is bytes:
+            try:
+                return value.decode("utf-8")
+            except UnicodeDecodeError:
+                raise _invalid_unicode_error(key, value)
+        return value
+
+    @staticmethod
+    def _decode_list(value):
+        return [v.decode("utf-8") if type(v) is bytes else v for v in value]
 
 
 class WebArgsTornadoCookiesMultiDictProxy(MultiDictProxy):
     """
     And a special override for cookies because they come back as objects with a
     `value` attribute we need to extract.
-    Also, does not use the `_unicode` decoding step
+    Also, does not use the bytes decoding step
     """
 
     def __getitem__(self, key):
-        cookie = self.data.get(key, core.missing)
-        if cookie is core.missing:
+        try:
+            cookie = self.data[key]
+        except KeyError:
             return core.missing
         if key in self.multiple_keys:
             return [cookie.value]
@@ -80,20 +115,44 @@ class WebArgsTornadoCookiesMultiDictProxy(MultiDictProxy):
 class TornadoParser(core.Parser):
     """Tornado request argument parser."""
 
+    #: Decode JSON bodies with `orjson <https://github.com/ijl/orjson>`_ rather
+    #: than the standard library. orjson is stricter than `json`, so this is
+    #: opt-in: see the "Tornado" section of the framework support docs.
+    USE_ORJSON: bool = False
+
+    def __init__(self, *args, **kwargs):
+        # fail when the parser is created, not on every request
+        if self.USE_ORJSON and orjson is None:
+            raise ImportError("TornadoParser.USE_ORJSON requires orjson")
+        super().__init__(*args, **kwargs)
+
     def _raw_load_json(self, req):
         """Return a json payload from the request for the core parser's load_json
 
         Checks the input mimetype and may return 'missing' if the mimetype is
         non-json, even if the request body is parseable as json."""
+        body = req.body
+        # nothing to parse, so don't bother checking the mimetype or raising and
+        # handling a decode error (e.g. GET requests to a view reading JSON)
+        if not body:
+            return core.missing
         if not is_json_request(req):
             return core.missing
 
         # request.body may be a concurrent.Future on streaming requests
         # this would cause a TypeError if we try to parse it
-        if isinstance(req.body, tornado.concurrent.Future):
+        # (the common case of a bytes body skips the isinstance check)
+        if type(body) is not bytes and isinstance(body, _Future):
             return core.missing
 
-        return core.parse_json(req.body)
+        if not self.USE_ORJSON:
+            return core.parse_json(body)
+        # orjson decodes bytes directly, but reports invalid UTF-8 with an
+        # empty `doc`, which load_json would mistake for an empty body
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise json.JSONDecodeError(exc.msg, exc.doc or repr(body), exc.pos) from exc
 
     def load_querystring(self, req, schema):
         """Return query params from the request as a MultiDictProxy."""
@@ -128,10 +187,7 @@ class TornadoParser(core.Parser):
         with a 400 error.
         """
         status_code = error_status_code or self.DEFAULT_VALIDATION_STATUS
-        if status_code == 422:
-            reason = "Unprocessable Entity"
-        else:
-            reason = None
+        reason = _REASONS.get(status_code)
         raise HTTPError(
             status_code,
             log_message=str(error.messages),
@@ -556,6 +556,19 @@ def test_multidict_proxy(input_dict):
     assert str_wrapped_multidict["foos"] in ("a", "b")
 
 
+def test_multidict_proxy_multiple_keys_depend_on_known_multi_fields():
+    class CustomField(fields.Str):
+        pass
+
+    class CustomSchema(Schema):
+        foos = CustomField()
+
+    schema = CustomSchema()
+    assert MultiDictProxy({}, schema).multiple_keys == frozenset()
+    custom = MultiDictProxy({}, schema, known_multi_fields=(CustomField,))
+    assert custom.multiple_keys == frozenset({"foos"})
+
+
 def test_parse_with_data_key(web_request):
     web_request.json = {"Content-Type": "application/json"}
 
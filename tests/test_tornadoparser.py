@@ -1,3 +1,4 @@
+import math
 from unittest import mock
 from urllib.parse import urlencode
 
@@ -11,9 +12,12 @@ import tornado.ioloop
 import tornado.web
 from tornado.testing import AsyncHTTPTestCase
 from webargs import fields, missing
+from webargs import tornadoparser
 from webargs.core import json, parse_json
 from webargs.tornadoparser import (
+    TornadoParser,
     WebArgsTornadoMultiDictProxy,
+    is_json_request,
     parser,
     use_args,
     use_kwargs,
@@ -38,11 +42,58 @@ def test_tornado_multidictproxy():
         ({"name": "Sophocles"}, "works", missing),
         ({"works": ["Antigone", "Oedipus Rex"]}, "works", ["Antigone", "Oedipus Rex"]),
         ({"works": ["Antigone", "Oedipus at Colonus"]}, "name", missing),
+        ({"name": [b"Sophocles"]}, "name", "Sophocles"),
+        ({"works": [b"Antigone", b"Ajax"]}, "works", ["Antigone", "Ajax"]),
+        ({"works": [b"Antigone", "Ajax"]}, "works", ["Antigone", "Ajax"]),
     ):
         proxy = WebArgsTornadoMultiDictProxy(dictval, author_schema)
         assert proxy.get(fieldname) == expected
 
 
+@pytest.mark.parametrize(
+    "dictval, fieldname",
+    [
+        ({"name": [b"\xff"]}, "name"),
+        # a truncated multi-byte sequence is invalid too
+        ({"name": [b"caf\xc3"]}, "name"),
+        ({"works": [b"Antigone", "Ajax", b"caf\xc3"]}, "works"),
+    ],
+)
+def test_tornado_multidictproxy_invalid_unicode(dictval, fieldname):
+    proxy = WebArgsTornadoMultiDictProxy(dictval, author_schema)
+    with pytest.raises(tornado.web.HTTPError) as excinfo:
+        proxy[fieldname]
+    assert excinfo.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        ("application/json", True),
+        ("application/json; charset=UTF-8", True),
+        ("application/vnd.api+json", True),
+        ("application/x-www-form-urlencoded", False),
+        ("text/plain", False),
+    ],
+)
+def test_is_json_request(content_type, expected):
+    request = make_request(headers={"Content-Type": content_type})
+    # check twice so that the cached result is exercised as well
+    assert is_json_request(request) is expected
+    assert is_json_request(request) is expected
+
+
+def test_is_json_request_without_content_type():
+    assert is_json_request(make_request()) is False
+
+
+def test_is_json_request_follows_header_changes():
+    request = make_request(headers={"Content-Type": "text/plain"})
+    assert is_json_request(request) is False
+    request.headers["Content-Type"] = "application/json"
+    assert is_json_request(request) is True
+
+
 class TestQueryArgs:
     def test_it_should_get_single_values(self):
         query = [("name", "Aeschylus")]
@@ -145,12 +196,68 @@ class TestJSONArgs:
         result = parser.load_json(request, author_schema)
         assert result is missing
 
+    def test_it_should_return_missing_on_empty_body(self, json_parser):
+        request = make_request(headers={"Content-Type": "application/json"})
+        result = json_parser.load_json(request, author_schema)
+        assert result is missing
+
     def test_it_should_handle_value_error_on_parse_json(self):
         request = make_request("this is json not")
         result = parser.load_json(request, author_schema)
         assert result is missing
 
 
+class OrjsonTornadoParser(TornadoParser):
+    USE_ORJSON = True
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_parser(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonTornadoParser()
+    return TornadoParser()
+
+
+class TestJSONDecoding:
+    def test_it_should_parse_json_body(self, json_parser):
+        request = make_json_request({"name": "Euripides", "works": ["Medea"]})
+        result = json_parser.load_json(request, author_schema)
+        assert result == {"name": "Euripides", "works": ["Medea"]}
+
+    def test_default_parser_uses_stdlib_json(self):
+        request = make_request(
+            body='{"n": 123456789012345678901234567890, "f": NaN}',
+            headers={"Content-Type": "application/json"},
+        )
+        result = TornadoParser().load_json(request, author_schema)
+        assert result["n"] == 123456789012345678901234567890
+        assert math.isnan(result["f"])
+
+    @pytest.mark.parametrize("body", ['{"n": NaN}', '{"n": 1e400}', '{"s": "\\ud800"}'])
+    def test_orjson_parser_rejects_non_strict_json(self, body):
+        pytest.importorskip("orjson")
+        request = make_request(body=body, headers={"Content-Type": "application/json"})
+        with pytest.raises(tornado.web.HTTPError) as excinfo:
+            OrjsonTornadoParser().load_json(request, author_schema)
+        assert excinfo.value.status_code == 400
+
+    def test_orjson_parser_raises_json_decode_error_from_raw_load(self):
+        pytest.importorskip("orjson")
+        request = make_request(
+            body=b'{"foo": "\xff"}', headers={"Content-Type": "application/json"}
+        )
+        with pytest.raises(json.JSONDecodeError) as excinfo:
+            OrjsonTornadoParser()._raw_load_json(request)
+        # a non-empty doc keeps load_json from treating this as an empty body
+        assert excinfo.value.doc != ""
+
+    def test_orjson_parser_requires_orjson(self, monkeypatch):
+        monkeypatch.setattr(tornadoparser, "orjson", None)
+        with pytest.raises(ImportError, match="orjson"):
+            OrjsonTornadoParser()
+
+
 class TestHeadersArgs:
     def test_it_should_get_single_values(self):
         query = {"name": "Euphorion"}
@@ -234,14 +341,26 @@ class TestParse:
         assert parsed["integer"] == [1, 2]
         assert parsed["string"] == value
 
-    def test_it_should_raise_when_json_is_invalid(self):
+    def test_it_should_raise_when_json_is_invalid(self, json_parser):
         attrs = {"foo": fields.Str()}
 
         request = make_request(
             body='{"foo": 42,}', headers={"Content-Type": "application/json"}
         )
         with pytest.raises(tornado.web.HTTPError) as excinfo:
-            parser.parse(attrs, request)
+            json_parser.parse(attrs, request)
+        error = excinfo.value
+        assert error.status_code == 400
+        assert error.messages == {"json": ["Invalid JSON body."]}
+
+    def test_it_should_raise_when_json_has_invalid_unicode(self, json_parser):
+        attrs = {"foo": fields.Str()}
+
+        request = make_request(
+            body=b'{"foo": "\xff"}', headers={"Content-Type": "application/json"}
+        )
+        with pytest.raises(tornado.web.HTTPError) as excinfo:
+            json_parser.parse(attrs, request)
         error = excinfo.value
         assert error.status_code == 400
         assert error.messages == {"json": ["Invalid JSON body."]}
@@ -268,6 +387,27 @@ class TestParse:
         assert parsed["string"] == value
         assert parsed["integer"] == [2]
 
+    def test_it_should_allow_pre_load_to_modify_cookies_for_empty_schema(self):
+        class CustomParser(TornadoParser):
+            def pre_load(self, location_data, *, schema, req, location):
+                location_data["extra"] = "added"
+                return location_data
+
+        request = make_cookie_request([("string", "value")])
+
+        parsed = CustomParser().parse(
+            {}, request, location="cookies", unknown=ma.INCLUDE
+        )
+
+        assert parsed == {"string": "value", "extra": "added"}
+
+    def test_it_should_include_cookies_for_empty_schema(self):
+        request = make_cookie_request([("string", "value")])
+
+        parsed = parser.parse({}, request, location="cookies", unknown=ma.INCLUDE)
+
+        assert parsed == {"string": "value"}
+
     def test_it_should_parse_files_arguments(self):
         attrs = {"string": fields.Str(), "integer": fields.List(fields.Int())}
 